@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+import asyncio
+import time
+import orjson
+
+class CachedClock:
+    """
+    Wall-clock time at one-second resolution, refreshed by a background task so
+    request handlers don't each read the clock. now_json is now, JSON-encoded.
+    When the task is not running (e.g. the server was started with lifespan off),
+    the time is refreshed on access instead, once the stored second has passed.
+    """
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.refresh()
+
+    def refresh(self):
+        # One clock read for all three, truncated to whole seconds
+        self.timestamp = int(time.time())
+        self._now = datetime.fromtimestamp(self.timestamp)
+        self._utcnow = datetime.utcfromtimestamp(self.timestamp)
+        self._now_json = orjson.dumps(self._now)
+
+    def ensure_fresh(self):
+        if self.task is None and int(time.time()) != self.timestamp:
+            self.refresh()
+
+    @property
+    def now(self) -> datetime:
+        self.ensure_fresh()
+        return self._now
+
+    @property
+    def utcnow(self) -> datetime:
+        self.ensure_fresh()
+        return self._utcnow
+
+    @property
+    def now_json(self) -> bytes:
+        self.ensure_fresh()
+        return self._now_json
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(1)
+            self.refresh()
+
+    async def start(self):
+        self.refresh()
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+clock = CachedClock()
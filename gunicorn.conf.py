@@ -0,0 +1,19 @@
+import multiprocessing
+import os
+
+# Loaded automatically by `gunicorn main:app` from the project directory
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+# One event loop per process; handlers are cheap and CPU-bound, so throughput scales with
+# processes rather than with concurrency inside one worker held back by the GIL. One worker
+# per core: more processes would only take turns on the same CPUs
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "workers.UvloopWorker"
+
+# Keep the worker heartbeat files off disk where a tmpfs is available
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+keepalive = 30
+backlog = 4096
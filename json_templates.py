@@ -0,0 +1,42 @@
+from typing import Any
+import hashlib
+import json
+import orjson
+
+# Helpers for response bodies that are JSON-encoded once and only have a few
+# request-specific fields filled in per call
+
+def json_template(payload: Any, *fields: str) -> bytes:
+    """
+    Pre-encode a JSON payload into a bytes %-template.
+    Every named field must hold the placeholder "__<field>__" in the payload; it is
+    turned into a %(<field>)s slot to be filled in by render_template.
+    """
+    template = orjson.dumps(payload).replace(b"%", b"%%")
+    for field in fields:
+        template = template.replace(b'"__%s__"' % field.encode(), b"%%(%s)s" % field.encode())
+    return template
+
+def render_template(template: bytes, **values: Any) -> bytes:
+    """
+    Fill the slots of a template built by json_template with JSON-encoded values.
+    bytes values are taken to be JSON already and are spliced in as they are.
+    """
+    return template % {field.encode(): encode_value(value) for field, value in values.items()}
+
+def encode_value(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    try:
+        return orjson.dumps(value)
+    except orjson.JSONEncodeError:
+        # orjson refuses strings holding lone surrogates, which json escapes as \udXXX
+        return json.dumps(value).encode()
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Weak entity tag for a pre-encoded body. Weak, because compression middleware
+    may change the bytes on the wire without touching the header.
+    """
+    return 'W/"%s"' % hashlib.sha1(body).hexdigest()
@@ -0,0 +1,198 @@
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# CORS headers, encoded once at import
+_CORS_ALLOW_METHODS = (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT")
+_CORS_SIMPLE_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-credentials", b"true"),
+]
+_CORS_PREFLIGHT_HEADERS = [
+    (b"vary", b"Origin"),
+    (b"access-control-allow-methods", b", ".join(_CORS_ALLOW_METHODS)),
+    (b"access-control-max-age", b"600"),
+    (b"access-control-allow-credentials", b"true"),
+]
+
+# Request bodies are small JSON documents; anything else is refused before it is read
+MAX_BODY_SIZE = 64 * 1024
+_BODY_METHODS = ("PATCH", "POST", "PUT")
+_TOO_LARGE_BODY = b'{"detail":"Request body too large"}'
+_UNSUPPORTED_TYPE_BODY = b'{"detail":"Request body must be application/json"}'
+
+# Headers a 304 response repeats from the 200 it stands in for
+_NOT_MODIFIED_HEADERS = frozenset((b"cache-control", b"content-location", b"etag", b"expires", b"vary"))
+
+class CORSPureASGI:
+    """
+    Pure ASGI CORS middleware for this API's open policy: any origin, method and header,
+    with credentials. In production, replace with a check against specific origins.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Preflight requests are answered here without reaching the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin), *_CORS_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            if request_method in _CORS_ALLOW_METHODS:
+                await send({"type": "http.response.start", "status": 204, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+            else:
+                body = b"Disallowed CORS method"
+                headers.append((b"content-type", b"text/plain; charset=utf-8"))
+                headers.append((b"content-length", b"%d" % len(body)))
+                await send({"type": "http.response.start", "status": 400, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+            return
+
+        # Credentialed requests must get their own origin back instead of "*"
+        if has_cookie:
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+        else:
+            cors_headers = _CORS_SIMPLE_HEADERS
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+class ConditionalGetASGI:
+    """
+    Pure ASGI middleware that answers GET and HEAD requests with 304 Not Modified when
+    their If-None-Match matches the ETag of the response. Only responses whose handler
+    sets an ETag are affected; the body is never hashed here.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+                break
+
+        if if_none_match is None:
+            await self.app(scope, receive, send)
+            return
+
+        # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+        request_tags = {tag.strip().removeprefix(b"W/") for tag in if_none_match.split(b",")}
+        not_modified = False
+
+        async def send_conditional(message: Message):
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                if message["status"] == 200:
+                    for name, value in message.get("headers", ()):
+                        if name == b"etag":
+                            not_modified = b"*" in request_tags or value.removeprefix(b"W/") in request_tags
+                            break
+                if not_modified:
+                    headers = [(name, value) for name, value in message["headers"] if name in _NOT_MODIFIED_HEADERS]
+                    await send({"type": "http.response.start", "status": 304, "headers": headers})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+            elif not_modified:
+                # The body was replaced by the empty 304 body
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_conditional)
+
+def is_json_media_type(content_type: bytes) -> bool:
+    # Same rule as FastAPI's body parsing: application/json or any application/*+json
+    media_type = content_type.partition(b";")[0].strip().lower()
+    return media_type == b"application/json" or (media_type.startswith(b"application/") and media_type.endswith(b"+json"))
+
+class BodyGuardASGI:
+    """
+    Pure ASGI middleware that refuses request bodies over MAX_BODY_SIZE with 413, and bodies
+    that are not JSON with 415, before the app parses them. A declared Content-Length is
+    checked up front; chunked bodies are counted as the app reads them. As with FastAPI,
+    a body with a missing or empty Content-Type is taken to be JSON. Requests without a
+    body, such as a bare POST to join a group, pass through.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in _BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = content_type = None
+        chunked = False
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+            elif name == b"content-type":
+                content_type = value
+            elif name == b"transfer-encoding":
+                chunked = True
+
+        if content_length is not None and content_length.isdigit() and int(content_length) > MAX_BODY_SIZE:
+            await self.reject(send, 413, _TOO_LARGE_BODY)
+            return
+
+        has_body = chunked or (content_length is not None and content_length != b"0")
+        if has_body and content_type and not is_json_media_type(content_type):
+            await self.reject(send, 415, _UNSUPPORTED_TYPE_BODY)
+            return
+
+        if content_length is not None or not chunked:
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > MAX_BODY_SIZE:
+                    # Raised inside the app's body read, and answered by its exception handler
+                    raise HTTPException(413, "Request body too large")
+            return message
+
+        await self.app(scope, receive_limited, send)
+
+    @staticmethod
+    async def reject(send: Send, status: int, body: bytes):
+        headers = [(b"content-type", b"application/json"), (b"content-length", b"%d" % len(body))]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
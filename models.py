@@ -0,0 +1,334 @@
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, StringConstraints
+from typing import List, Optional, Dict, Any, Annotated
+from datetime import date, datetime
+from enum import Enum
+
+# Shared config for every model, kept in one place: unknown fields are dropped
+class APIModel(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+# New Models for Home, About, Contact
+class FeaturedTrip(APIModel):
+    id: str
+    title: str
+    image_url: str
+    description: str
+    days: int
+    avg_rating: float
+
+class Banner(APIModel):
+    id: str
+    image_url: str
+    title: str
+    description: str
+    link: str
+
+class Testimonial(APIModel):
+    id: str
+    name: str
+    photo_url: Optional[str] = None
+    content: str
+    rating: float
+
+class HomeResponse(APIModel):
+    featured_trips: List[FeaturedTrip]
+    banners: List[Banner]
+    testimonials: List[Testimonial]
+
+class AboutResponse(APIModel):
+    title: str
+    content: str
+
+class ContactResponse(APIModel):
+    email: str
+    phone: str
+
+class ContactMessage(APIModel):
+    name: str
+    email: EmailStr
+    message: str
+
+class MessageResponse(APIModel):
+    status: str
+    message: str
+
+# Auth Models
+
+# Shape-only email check for requests that just pass the address along;
+# full EmailStr validation is kept where the address is stored.
+# pydantic-core compiles the pattern itself, once, when the model is built
+_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+EmailStrFast = Annotated[str, StringConstraints(pattern=_EMAIL_PATTERN, max_length=254)]
+
+class UserRegister(APIModel):
+    email: EmailStr
+    username: str = Field(..., min_length=3, max_length=50)
+    password: str = Field(..., min_length=8)
+    full_name: str = Field(..., min_length=3, max_length=100)
+
+class UserLogin(APIModel):
+    email: EmailStrFast
+    password: str
+
+class ForgotPassword(APIModel):
+    email: EmailStrFast
+
+class ResetPassword(APIModel):
+    token: str
+    new_password: str = Field(..., min_length=8)
+
+class Token(APIModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+
+class TokenData(APIModel):
+    user_id: str = None
+
+class UserResponse(APIModel):
+    id: str
+    username: str
+    email: EmailStr
+    full_name: str
+    created_at: datetime
+
+# Common Models
+class LocationBase(APIModel):
+    city: str
+    country: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+# Group Models
+class GroupCreate(APIModel):
+    name: str = Field(..., min_length=3, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
+    trip_id: str
+
+class GroupResponse(APIModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    trip_id: str
+    members: List[str]
+    created_by: str
+    created_at: datetime
+
+class GroupInvite(APIModel):
+    email: EmailStrFast
+    message: Optional[str] = None
+    group_id: str
+
+# Blog Models
+class BlogCreate(APIModel):
+    title: str = Field(..., min_length=3, max_length=100)
+    content: str
+    trip_id: Optional[str] = None
+    tags: Optional[List[str]] = None
+    is_public: bool = True
+
+class BlogResponse(APIModel):
+    id: str
+    title: str
+    content: str
+    trip_id: Optional[str] = None
+    tags: List[str] = []
+    is_public: bool
+    author_id: str
+    created_at: datetime
+    updated_at: datetime
+
+# Weather Models
+class WeatherData(APIModel):
+    location: LocationBase
+    date: date
+    temperature: float
+    conditions: str
+    humidity: int
+    wind_speed: float
+    precipitation_chance: float
+
+class WeatherCheckRequest(APIModel):
+    trip_id: str
+    destination: str
+    start_date: date
+    end_date: date
+
+class SevereWeatherDay(APIModel):
+    date: date
+    condition: str
+    risk_level: str
+    reason: str
+
+class ProposedItineraryChange(APIModel):
+    new_start_date: date
+    new_end_date: date
+    new_destination: str
+
+class WeatherCheckResponse(APIModel):
+    message: str
+    severe_weather_days: List[SevereWeatherDay]
+    recommended_actions: List[str]
+    proposed_itinerary_change: ProposedItineraryChange
+    user_decision_required: bool
+
+class TripChangeRequest(APIModel):
+    trip_id: str
+    confirm: bool
+    new_start_date: date
+    new_destination: str
+
+class NewItinerary(APIModel):
+    start_date: date
+    end_date: date
+    destination: str
+
+class TripChangeResponse(APIModel):
+    message: str
+    trip_id: str
+    new_itinerary: NewItinerary
+
+# Traffic Models
+class TrafficLevel(str, Enum):
+    LOW = "LOW"
+    MODERATE = "MODERATE"
+    HIGH = "HIGH"
+    VERY_HIGH = "VERY_HIGH"
+
+class TrafficInfo(APIModel):
+    origin: LocationBase
+    destination: LocationBase
+    date: date
+    time: str
+    traffic_level: TrafficLevel
+    estimated_delay_minutes: int
+    alternative_routes: Optional[List[str]] = None
+
+# Trip Plan Models
+class TripPlanExtractRequest(APIModel):
+    text: str
+
+class TripPlanExtractResponse(APIModel):
+    output: Dict[str, Any]
+    metadata: Dict[str, Any]
+
+class BudgetBreakdown(APIModel):
+    total: str
+    breakdown: Dict[str, str]
+
+class GeoLocation(APIModel):
+    location: str
+    latitude: str
+    longitude: str
+
+class Logistics(APIModel):
+    departure_time: str
+    arrival_time: str
+    tips: str
+
+class Checkpoint(APIModel):
+    origin: GeoLocation
+    destination: GeoLocation
+    logistics: Logistics
+
+class FoodPlace(APIModel):
+    title: str
+    address: str
+    latitude: float
+    longitude: float
+    rating: float
+    ratingCount: int
+    category: str
+    phoneNumber: str
+    cid: str
+    cost: str
+    website: Optional[str] = None
+
+class MealPlan(APIModel):
+    breakfast: FoodPlace
+    launch: FoodPlace
+    dinner: FoodPlace
+
+class Accommodation(APIModel):
+    title: str
+    address: str
+    latitude: float
+    longitude: float
+    rating: float
+    ratingCount: int
+    category: str
+    phoneNumber: str
+    cid: str
+    website: Optional[str] = None
+
+class SpotSuggestion(APIModel):
+    name: str
+    description: str
+    latitude: float
+    longitude: float
+    recommendedTime: str
+    estimatedDurationHours: int
+
+class TripPlanResponse(APIModel):
+    output: Dict[str, Any]
+    metadata: Dict[str, Any]
+
+# AI Recommendation Models
+class RecommendationRequest(APIModel):
+    location: Optional[LocationBase] = None
+    travel_dates: Optional[List[date]] = None
+    preferences: Optional[Dict[str, Any]] = None
+    budget_range: Optional[Dict[str, float]] = None
+    group_size: Optional[int] = None
+
+class Recommendation(APIModel):
+    id: str
+    type: str  # 'DESTINATION', 'ACTIVITY', 'ACCOMMODATION', etc.
+    title: str
+    description: str
+    location: Optional[LocationBase] = None
+    estimated_cost: Optional[float] = None
+    rating: Optional[float] = None
+    images: List[str] = []
+    tags: List[str] = []
+
+# Profile Models
+
+class TripBasicInfo(APIModel):
+    tripId: str
+    tripName: str
+    startDate: date
+    days: int
+    people: int
+    budget: float
+    status: str
+
+class UserProfile(APIModel):
+    userId: str
+    name: str
+    email: EmailStr
+    currentTrip: Optional[TripBasicInfo] = None
+    pastTrips: List[TripBasicInfo] = []
+
+class TripDetails(APIModel):
+    tripId: str
+    tripName: str
+    startDate: date
+    status: str
+    days: int
+    budget: float
+    people: int
+    placesVisited: List[str] = []
+    placesLeft: List[str] = []
+
+class PlaceUpdateRequest(APIModel):
+    place: str
+
+class PlaceUpdateResponse(APIModel):
+    message: str
+    placesVisited: List[str]
+    placesLeft: List[str]
+
+class AddPlaceResponse(APIModel):
+    message: str
+    placesLeft: List[str]
@@ -0,0 +1,67 @@
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+from typing import Any, Mapping, Optional, Type
+from pydantic import TypeAdapter
+import gzip
+
+from json_templates import body_etag
+
+class StaticResponse(Response):
+    """
+    Response for a constant body, built once at import and returned by its handler on
+    every request. Each send gets its own copy of the header list, since middleware
+    such as GZipMiddleware edits the headers of the response start message in place.
+    """
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": list(self.raw_headers)})
+        await send({"type": "http.response.body", "body": self.body})
+
+class PrecompressedResponse(StaticResponse):
+    """
+    StaticResponse that also keeps its body gzip-compressed (once, at level 9) and sends
+    that to clients that accept gzip. GZipMiddleware passes responses that already have
+    a Content-Encoding through, so the body is no longer compressed on every request.
+    """
+    def __init__(
+        self,
+        content: bytes,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None
+    ):
+        super().__init__(content, status_code, {**(headers or {}), "Vary": "Accept-Encoding"}, media_type)
+        self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        self.gzip_raw_headers = [
+            *((name, value) for name, value in self.raw_headers if name != b"content-length"),
+            (b"content-encoding", b"gzip"),
+            (b"content-length", b"%d" % len(self.gzip_body)),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                if b"gzip" in value:
+                    await send({"type": "http.response.start", "status": self.status_code, "headers": list(self.gzip_raw_headers)})
+                    await send({"type": "http.response.body", "body": self.gzip_body})
+                    return
+                break
+        await super().__call__(scope, receive, send)
+
+def example_response(
+    model: Any,
+    example: Any,
+    *,
+    etag: bool = False,
+    headers: Optional[Mapping[str, str]] = None,
+    response_class: Type[StaticResponse] = StaticResponse
+) -> StaticResponse:
+    """
+    Validate a constant example against its model and encode it, once, as the JSON body
+    of a response for its handler to return on every request. With etag=True the
+    response also carries a weak ETag of the body.
+    """
+    adapter = TypeAdapter(model)
+    body = adapter.dump_json(adapter.validate_python(example))
+    if etag:
+        headers = {"ETag": body_etag(body), **(headers or {})}
+    return response_class(content=body, media_type="application/json", headers=headers)
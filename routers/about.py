@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+
+from models import AboutResponse
+from responses import PrecompressedResponse, example_response
+
+# About Router
+about_router = APIRouter(prefix="/v1/about", tags=["About"])
+
+_ABOUT_EXAMPLE = {
+    "title": "About WanderWise",
+    "content": "We help travelers plan smart, personalized trips with our AI-powered platform. Founded in 2023, WanderWise combines advanced technology with local expertise to create unforgettable travel experiences."
+}
+# The page only changes with a deploy, so clients may keep it for an hour without revalidating,
+# and its gzip encoding is made here once rather than by the middleware on each request
+_ABOUT_RESPONSE = example_response(
+    AboutResponse,
+    _ABOUT_EXAMPLE,
+    etag=True,
+    headers={"Cache-Control": "public, max-age=3600, immutable"},
+    response_class=PrecompressedResponse
+)
+
+_ABOUT_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": {"title": "About WanderWise", "content": "We help travelers plan smart..."}}}
+    }
+}
+
+@about_router.get("", response_model=AboutResponse, responses=_ABOUT_RESPONSES)
+async def get_about():
+    """
+    Get information about the company/platform.
+    """
+    # This is just an example implementation
+    return _ABOUT_RESPONSE
@@ -0,0 +1,145 @@
+from fastapi import APIRouter, Body, Response, status
+import orjson
+
+from clock import clock
+from json_templates import json_template, render_template
+from models import UserRegister, UserLogin, ForgotPassword, ResetPassword, Token, UserResponse
+from responses import StaticResponse
+
+# Auth Router
+auth_router = APIRouter(prefix="/v1/auth", tags=["Auth"])
+
+_REGISTER_EXAMPLE = {
+    "id": "b0e42fe7-31a0-4f2b-9b4e-87c5534d9fdf",
+    "username": "newuser123",
+    "email": "user@example.com",
+    "full_name": "John Smith",
+    "created_at": "__created_at__"
+}
+# Check the example against UserResponse once; bodies rendered from it are never validated
+UserResponse.model_validate({**_REGISTER_EXAMPLE, "created_at": clock.now})
+_REGISTER_TEMPLATE = json_template(_REGISTER_EXAMPLE, "created_at")
+
+@auth_router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED, 
+                 responses={
+                     201: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "id": "b0e42fe7-31a0-4f2b-9b4e-87c5534d9fdf",
+                                     "username": "newuser123",
+                                     "email": "user@example.com",
+                                     "full_name": "John Smith",
+                                     "created_at": "2023-01-01T00:00:00"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def register(user_data: UserRegister = Body(
+    ...,
+    example={
+        "email": "user@example.com",
+        "username": "newuser123",
+        "password": "securepassword123",
+        "full_name": "John Smith"
+    }
+)):
+    """
+    Register a new user.
+    """
+    # This is just an example implementation
+    return Response(
+        content=render_template(_REGISTER_TEMPLATE, created_at=clock.now_json),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
+
+_LOGIN_BODY = orjson.dumps({
+    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "token_type": "bearer"
+})
+_LOGIN_RESPONSE = StaticResponse(content=_LOGIN_BODY, media_type="application/json")
+
+@auth_router.post("/login", response_model=Token,
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                                     "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                                     "token_type": "bearer"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def login(user_data: UserLogin = Body(
+    ...,
+    example={
+        "email": "user@example.com",
+        "password": "securepassword123"
+    }
+)):
+    """
+    Authenticate a user and provide access and refresh tokens.
+    """
+    # This is just an example implementation
+    return _LOGIN_RESPONSE
+
+_FORGOT_PASSWORD_BODY = orjson.dumps({"message": "Password reset instructions sent to your email"})
+_FORGOT_PASSWORD_RESPONSE = StaticResponse(content=_FORGOT_PASSWORD_BODY, media_type="application/json")
+
+@auth_router.post("/forgot-password", status_code=status.HTTP_200_OK,
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "message": "Password reset instructions sent to your email"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def forgot_password(forgot_pwd: ForgotPassword = Body(
+    ...,
+    example={
+        "email": "user@example.com"
+    }
+)):
+    """
+    Send a password reset link to the user's email.
+    """
+    # This is just an example implementation
+    return _FORGOT_PASSWORD_RESPONSE
+
+_RESET_PASSWORD_BODY = orjson.dumps({"message": "Password has been reset successfully"})
+_RESET_PASSWORD_RESPONSE = StaticResponse(content=_RESET_PASSWORD_BODY, media_type="application/json")
+
+@auth_router.post("/reset-password", status_code=status.HTTP_200_OK,
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "message": "Password has been reset successfully"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def reset_password(reset_pwd: ResetPassword = Body(
+    ...,
+    example={
+        "token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+        "new_password": "newSecurePassword123"
+    }
+)):
+    """
+    Reset a user's password using a valid reset token.
+    """
+    # This is just an example implementation
+    return _RESET_PASSWORD_RESPONSE
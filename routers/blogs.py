@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Body, Query, Response, status
+from typing import Annotated, List, Optional
+
+from clock import clock
+from json_templates import json_template, render_template
+from models import BlogCreate, BlogResponse
+
+# Blog Router
+blog_router = APIRouter(prefix="/v1/blogs", tags=["Blogs"])
+
+_BLOG_EXAMPLE = {
+    "id": "1",
+    "title": "My Amazing Paris Adventure",
+    "content": "# Paris Trip\n\nWhat an amazing time we had...",
+    "trip_id": "1",
+    "tags": ["paris", "france", "travel"],
+    "is_public": True,
+    "author_id": "user123",
+    "created_at": "__created_at__",
+    "updated_at": "__updated_at__"
+}
+# Rendered blog bodies skip validation, so the example is checked here with sample timestamps
+BlogResponse.model_validate({**_BLOG_EXAMPLE, "created_at": clock.now, "updated_at": clock.now})
+_BLOG_TEMPLATE = json_template(_BLOG_EXAMPLE, "created_at", "updated_at")
+_BLOGS_TEMPLATE = json_template([_BLOG_EXAMPLE], "created_at", "updated_at")
+# Documented with fixed timestamps in place of the placeholders
+_BLOG_DOC_EXAMPLE = {**_BLOG_EXAMPLE, "created_at": "2023-01-01T00:00:00", "updated_at": "2023-01-01T00:00:00"}
+
+@blog_router.post("", response_model=BlogResponse, status_code=status.HTTP_201_CREATED,
+                 responses={
+                     201: {
+                         "content": {
+                             "application/json": {
+                                 "example": _BLOG_DOC_EXAMPLE
+                             }
+                         }
+                     }
+                 })
+async def create_blog(blog: BlogCreate = Body(
+    ...,
+    example={
+        "title": "My Amazing Paris Adventure",
+        "content": "# Paris Trip\n\nWhat an amazing time we had...",
+        "trip_id": "1",
+        "tags": ["paris", "france", "travel"],
+        "is_public": True
+    }
+)):
+    """
+    Create a new blog post about your travel experiences.
+    """
+    # This is just an example implementation
+    # Read the clock once so both timestamps agree
+    now = clock.now_json
+    return Response(
+        content=render_template(_BLOG_TEMPLATE, created_at=now, updated_at=now),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
+
+@blog_router.get("", response_model=List[BlogResponse],
+                responses={
+                    200: {
+                        "content": {
+                            "application/json": {
+                                "example": [_BLOG_DOC_EXAMPLE]
+                            }
+                        }
+                    }
+                })
+async def get_blogs(
+    author_id: Annotated[Optional[str], Query(description="Filter blogs by author ID", openapi_examples={"example": {"value": "user123"}})] = None,
+    trip_id: Annotated[Optional[str], Query(description="Filter blogs by trip ID", openapi_examples={"example": {"value": "trip001"}})] = None,
+    tag: Annotated[Optional[str], Query(description="Filter blogs by tag", openapi_examples={"example": {"value": "paris"}})] = None,
+    limit: Annotated[int, Query(description="Maximum number of blogs to return", ge=1, le=100)] = 10
+):
+    """
+    Get a list of blog posts.
+    """
+    # This is just an example implementation
+    now = clock.now_json
+    return Response(
+        content=render_template(_BLOGS_TEMPLATE, created_at=now, updated_at=now),
+        media_type="application/json"
+    )
@@ -0,0 +1,156 @@
+from fastapi import APIRouter, Body, Depends, Path, Query, Response, status
+from typing import Dict, List, Optional
+import orjson
+
+from clock import clock
+from json_templates import json_template, render_template
+from models import GroupCreate, GroupResponse, GroupInvite
+from responses import StaticResponse
+from security import get_current_user
+
+# Group Router
+group_router = APIRouter(prefix="/v1/groups", tags=["Groups"])
+
+_GROUP_EXAMPLE = {
+    "id": "1",
+    "name": "Europe Summer Trip",
+    "description": "Planning our summer adventure",
+    "trip_id": "1",
+    "members": ["user123", "user456"],
+    "created_by": "user123",
+    "created_at": "__created_at__"
+}
+# Validated once with a sample timestamp, as the rendered group bodies never are
+GroupResponse.model_validate({**_GROUP_EXAMPLE, "created_at": clock.now})
+_GROUP_TEMPLATE = json_template(_GROUP_EXAMPLE, "created_at")
+_GROUPS_TEMPLATE = json_template([_GROUP_EXAMPLE], "created_at")
+
+@group_router.post("", response_model=GroupResponse, status_code=status.HTTP_201_CREATED,
+                 responses={
+                     201: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "id": "1",
+                                     "name": "Europe Summer Trip",
+                                     "description": "Planning our summer adventure",
+                                     "trip_id": "1",
+                                     "members": ["user123", "user456"],
+                                     "created_by": "user123",
+                                     "created_at": "2023-01-01T00:00:00"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def create_group(group: GroupCreate = Body(
+    ...,
+    example={
+        "name": "Europe Summer Trip",
+        "description": "Planning our summer adventure",
+        "trip_id": "1"
+    }
+)):
+    """
+    Create a new travel group for collaborative trip planning.
+    """
+    # This is just an example implementation
+    return Response(
+        content=render_template(_GROUP_TEMPLATE, created_at=clock.now_json),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
+
+_INVITE_BODY = orjson.dumps({"message": "Invitation sent to user@example.com"})
+_INVITE_RESPONSE = StaticResponse(content=_INVITE_BODY, media_type="application/json")
+
+@group_router.post("/{group_id}/invite", status_code=status.HTTP_200_OK,
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "message": "Invitation sent to user@example.com"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def invite_to_group(
+    group_id: str = Path(..., description="The ID of the group to send invites for", examples={"example": {"value": "123"}}),
+    invite: GroupInvite = Body(
+    ...,
+    example={
+        "email": "user@example.com",
+        "message": "Join our group for an amazing trip!",
+        "group_id": "123" 
+    }
+)):
+    """
+    Invite a user to join a travel group.
+    """
+    # This is just an example implementation
+    return _INVITE_RESPONSE
+
+_JOIN_GROUP_TEMPLATE = json_template({
+    "message": "Successfully joined the group",
+    "group_id": "__group_id__",
+    "group_name": "Europe Summer Trip"
+}, "group_id")
+
+@group_router.post("/{group_id}/join", status_code=status.HTTP_200_OK,
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": {
+                                     "message": "Successfully joined the group",
+                                     "group_id": "123",
+                                     "group_name": "Europe Summer Trip"
+                                 }
+                             }
+                         }
+                     }
+                 })
+async def join_group(
+    group_id: str = Path(..., description="The ID of the group to join", examples={"example": {"value": "123"}}),
+    current_user: Dict = Depends(get_current_user)
+):
+    """
+    Join an existing travel group that you've been invited to.
+    """
+    # This is just an example implementation
+    return Response(content=render_template(_JOIN_GROUP_TEMPLATE, group_id=group_id), media_type="application/json")
+
+@group_router.get("", response_model=List[GroupResponse],
+                 responses={
+                     200: {
+                         "content": {
+                             "application/json": {
+                                 "example": [
+                                     {
+                                         "id": "1",
+                                         "name": "Europe Summer Trip",
+                                         "description": "Planning our summer adventure",
+                                         "trip_id": "1",
+                                         "members": ["user123", "user456"],
+                                         "created_by": "user123",
+                                         "created_at": "2023-01-01T00:00:00"
+                                     }
+                                 ]
+                             }
+                         }
+                     }
+                 })
+async def get_groups(
+    user_id: Optional[str] = Query(None, description="Filter groups by user ID", examples={"example": {"value": "user123"}}),
+    active_only: bool = Query(False, description="Show only active groups")
+):
+    """
+    Get all groups the current user is a member of.
+    """
+    # This is just an example implementation
+    return Response(
+        content=render_template(_GROUPS_TEMPLATE, created_at=clock.now_json),
+        media_type="application/json"
+    )
@@ -0,0 +1,61 @@
+from fastapi import APIRouter
+
+from models import HomeResponse
+from responses import PrecompressedResponse, example_response
+
+# Home Router
+home_router = APIRouter(prefix="/v1/home", tags=["Home"])
+
+_HOME_EXAMPLE = {
+    "featured_trips": [
+        {
+            "id": "1",
+            "title": "Paris Getaway",
+            "image_url": "https://example.com/images/paris.jpg",
+            "description": "Experience the city of lights",
+            "days": 3,
+            "avg_rating": 4.8
+        }
+    ],
+    "banners": [
+        {
+            "id": "1",
+            "image_url": "https://example.com/images/banner1.jpg",
+            "title": "Summer Sale",
+            "description": "Get 20% off on all summer trips",
+            "link": "/promotions/summer"
+        }
+    ],
+    "testimonials": [
+        {
+            "id": "1",
+            "name": "John Smith",
+            "photo_url": "https://example.com/images/john.jpg",
+            "content": "WanderWise made our trip planning so easy!",
+            "rating": 5.0
+        }
+    ]
+}
+# The page only changes with a deploy, so clients may keep it for an hour without revalidating,
+# and its gzip encoding is made here once rather than by the middleware on each request
+_HOME_RESPONSE = example_response(
+    HomeResponse,
+    _HOME_EXAMPLE,
+    etag=True,
+    headers={"Cache-Control": "public, max-age=3600, immutable"},
+    response_class=PrecompressedResponse
+)
+
+_HOME_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": _HOME_EXAMPLE}}
+    }
+}
+
+@home_router.get("", response_model=HomeResponse, responses=_HOME_RESPONSES)
+async def get_homepage():
+    """
+    Get homepage information including featured trips, banners, and testimonials.
+    """
+    # This is just an example implementation
+    return _HOME_RESPONSE
@@ -0,0 +1,229 @@
+from fastapi import APIRouter, HTTPException, Path, Request, Response
+from fastapi.exceptions import RequestValidationError
+from typing import Any, Dict
+from pydantic import ValidationError
+import json
+import orjson
+
+from models import UserProfile, TripDetails, PlaceUpdateRequest, PlaceUpdateResponse, AddPlaceResponse
+from json_templates import encode_value
+from responses import example_response
+
+# Profile Router
+profile_router = APIRouter(prefix="/v1/profile", tags=["Profile"])
+
+# The place endpoints only need the one string field of PlaceUpdateRequest, so they read it
+# straight from the raw body instead of declaring a Body parameter and building the model.
+# The request bodies are documented by hand, as FastAPI generated them for the model, and
+# main.py adds the PlaceUpdateRequest component they refer to.
+_PLACE_UPDATE_REF = {"$ref": "#/components/schemas/PlaceUpdateRequest"}
+
+def place_request_body(media_type: Dict[str, Any]) -> Dict[str, Any]:
+    return {"requestBody": {"content": {"application/json": media_type}, "required": True}}
+
+async def read_place(request: Request) -> str:
+    """
+    Read the place from a PlaceUpdateRequest body. Bodies without a string place are
+    parsed and validated the way FastAPI does it instead, to raise the same 422 errors.
+    """
+    body = await request.body()
+    try:
+        place = orjson.loads(body).get("place")
+    except (orjson.JSONDecodeError, AttributeError):
+        place = None
+    if isinstance(place, str):
+        return place
+    return validate_place(body)
+
+def validate_place(body: bytes) -> str:
+    # Mirrors FastAPI's body handling: decoded with json, empty or null is a missing body
+    try:
+        data = json.loads(body) if body else None
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", exc.pos), "msg": "JSON decode error", "input": {}, "ctx": {"error": exc.msg}}],
+            body=exc.doc
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="There was an error parsing the body")
+    if data is None:
+        error = ValidationError.from_exception_data("Field required", [{"type": "missing", "loc": ("body",), "input": {}}]).errors()[0]
+        raise RequestValidationError([{**error, "input": None}], body=None)
+    try:
+        return PlaceUpdateRequest.model_validate(data, from_attributes=True).place
+    except ValidationError as exc:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in exc.errors()], body=data)
+
+_PROFILE_EXAMPLE = {
+    "userId": "u123",
+    "name": "John Doe",
+    "email": "john@example.com",
+    "currentTrip": {
+        "tripId": "t001",
+        "tripName": "Dhaka to Sylhet Adventure",
+        "startDate": "2024-10-24",
+        "days": 4,
+        "people": 3,
+        "budget": 5000,
+        "status": "active"
+    },
+    "pastTrips": [
+        {
+            "tripId": "t000",
+            "tripName": "Cox's Bazar Getaway",
+            "startDate": "2023-12-10",
+            "days": 3,
+            "people": 2,
+            "budget": 7000,
+            "status": "completed"
+        }
+    ]
+}
+_PROFILE_RESPONSE = example_response(UserProfile, _PROFILE_EXAMPLE)
+
+_PROFILE_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": _PROFILE_EXAMPLE}}
+    }
+}
+
+# The profile and trip details handlers ignore their parameters, so these are documented
+# by hand, as FastAPI generated them for the declared parameters, and nothing is parsed
+# or validated per request
+@profile_router.get("", response_model=UserProfile, responses=_PROFILE_RESPONSES, openapi_extra={"parameters": [{
+    "name": "user_id",
+    "in": "query",
+    "required": False,
+    "description": "User ID to fetch profile for (defaults to authenticated user)",
+    "schema": {
+        "anyOf": [{"type": "string"}, {"type": "null"}],
+        "description": "User ID to fetch profile for (defaults to authenticated user)",
+        "examples": {"example": {"value": "u123"}},
+        "title": "User Id"
+    }
+}]})
+async def get_user_profile():
+    """
+    Get the user's profile information including current and past trips.
+    """
+    # This is just an example implementation
+    return _PROFILE_RESPONSE
+
+_TRIP_DETAILS_EXAMPLE = {
+    "tripId": "t001",
+    "tripName": "Dhaka to Sylhet Adventure",
+    "startDate": "2024-10-24",
+    "status": "active",
+    "days": 4,
+    "budget": 5000,
+    "people": 3,
+    "placesVisited": [
+        "Lalakhal",
+        "Bisnakandi"
+    ],
+    "placesLeft": [
+        "Ratargul Swamp Forest",
+        "Jaflong",
+        "Shahjalal Dargah"
+    ]
+}
+_TRIP_DETAILS_RESPONSE = example_response(TripDetails, _TRIP_DETAILS_EXAMPLE)
+
+_TRIP_DETAILS_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": _TRIP_DETAILS_EXAMPLE}}
+    }
+}
+
+@profile_router.get("/trips/{trip_id}", response_model=TripDetails, responses=_TRIP_DETAILS_RESPONSES, openapi_extra={"parameters": [{
+    "name": "trip_id",
+    "in": "path",
+    "required": True,
+    "description": "ID of the trip to get details for",
+    "schema": {
+        "description": "ID of the trip to get details for",
+        "examples": {"example": {"value": "t001"}},
+        "title": "Trip Id",
+        "type": "string"
+    }
+}]})
+async def get_trip_details():
+    """
+    Get detailed information about a specific trip, including todo list.
+    """
+    # This is just an example implementation
+    return _TRIP_DETAILS_RESPONSE
+
+_PLACE_VISITED_EXAMPLE = {
+    "message": "Marked 'Ratargul Swamp Forest' as visited.",
+    "placesVisited": [
+        "Lalakhal",
+        "Bisnakandi",
+        "Ratargul Swamp Forest"
+    ],
+    "placesLeft": [
+        "Jaflong",
+        "Shahjalal Dargah"
+    ]
+}
+PlaceUpdateResponse.model_validate(_PLACE_VISITED_EXAMPLE)
+# Only the place comes from the request: the body is encoded once around it, split where
+# the place goes, and each response joins the two halves with the JSON-escaped place
+_PLACE_VISITED_PREFIX, _PLACE_VISITED_SUFFIX = orjson.dumps(
+    {**_PLACE_VISITED_EXAMPLE, "message": "Marked '__place__' as visited."}
+).split(b"__place__")
+
+_PLACE_VISITED_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": _PLACE_VISITED_EXAMPLE}}
+    }
+}
+
+@profile_router.put("/trips/{trip_id}/todolist/visit", response_model=PlaceUpdateResponse, responses=_PLACE_VISITED_RESPONSES,
+                   openapi_extra=place_request_body({"schema": {
+                       "allOf": [_PLACE_UPDATE_REF],
+                       "examples": {"example": {"summary": "Mark place as visited", "value": {"place": "Ratargul Swamp Forest"}}},
+                       "title": "Place Update"
+                   }}))
+async def mark_place_visited(
+    request: Request,
+    trip_id: str = Path(..., description="ID of the trip to update", examples={"example": {"value": "t001"}})
+):
+    """
+    Mark a place as visited in the trip's todo list.
+    """
+    # This is just an example implementation
+    return Response(
+        # encode_value gives a quoted JSON string; the quotes are dropped to splice it into the message
+        content=_PLACE_VISITED_PREFIX + encode_value(await read_place(request))[1:-1] + _PLACE_VISITED_SUFFIX,
+        media_type="application/json"
+    )
+
+_ADD_PLACE_EXAMPLE = {
+    "message": "Place added to to-do list.",
+    "placesLeft": [
+        "Jaflong",
+        "Shahjalal Dargah",
+        "Sreemangal Tea Garden"
+    ]
+}
+_ADD_PLACE_RESPONSE = example_response(AddPlaceResponse, _ADD_PLACE_EXAMPLE)
+
+_ADD_PLACE_RESPONSES = {
+    200: {
+        "content": {"application/json": {"example": _ADD_PLACE_EXAMPLE}}
+    }
+}
+
+@profile_router.post("/trips/{trip_id}/todolist", response_model=AddPlaceResponse, responses=_ADD_PLACE_RESPONSES,
+                    openapi_extra=place_request_body({"example": {"place": "Sreemangal Tea Garden"}, "schema": _PLACE_UPDATE_REF}))
+async def add_place_to_todolist(
+    request: Request,
+    trip_id: str = Path(..., description="ID of the trip to add a place to", example="t001")
+):
+    """
+    Add a new place to the trip's todo list.
+    """
+    # This is just an example implementation
+    await read_place(request)
+    return _ADD_PLACE_RESPONSE
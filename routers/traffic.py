@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Path
+from typing import Annotated
+
+from models import TrafficInfo
+from responses import example_response
+
+# Traffic Router
+traffic_router = APIRouter(prefix="/v1/traffic", tags=["Traffic"])
+
+_TRAFFIC_INFO_EXAMPLE = {
+    "origin": {"city": "Paris", "country": "France", "latitude": 48.8566, "longitude": 2.3522},
+    "destination": {"city": "Versailles", "country": "France", "latitude": 48.8044, "longitude": 2.1232},
+    "date": "2025-06-01",
+    "time": "09:00",
+    "traffic_level": "MODERATE",
+    "estimated_delay_minutes": 15,
+    "alternative_routes": ["Via A13", "Via N118"]
+}
+_TRAFFIC_INFO_RESPONSE = example_response(TrafficInfo, _TRAFFIC_INFO_EXAMPLE, etag=True)
+
+@traffic_router.get("/info/{trip_id}", response_model=TrafficInfo,
+                  responses={
+                      200: {
+                          "content": {
+                              "application/json": {
+                                  "example": _TRAFFIC_INFO_EXAMPLE
+                              }
+                          }
+                      }
+                  })
+async def get_traffic_info(
+    trip_id: Annotated[str, Path(description="ID of the trip to get traffic information for", openapi_examples={"example": {"value": "trip123"}})]
+):
+    """
+    Get traffic information for a trip's route.
+    """
+    # This is just an example implementation
+    return _TRAFFIC_INFO_RESPONSE
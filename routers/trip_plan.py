@@ -0,0 +1,275 @@
+from fastapi import APIRouter, Query
+from typing import Annotated, Optional
+from datetime import date
+
+from models import TripPlanExtractResponse, TripPlanResponse
+from responses import example_response
+
+# Trip Plan Router
+trip_plan_router = APIRouter(prefix="/v1/tripPlan", tags=["TripPlan"])
+
+_EXTRACT_EXAMPLE = {
+    "output": {
+        "origin": "Dhaka",
+        "destination": "Sylhet",
+        "days": "4",
+        "budget": "5000",
+        "people": "4",
+        "preferences": "",
+        "tripType": "oneWay",
+        "journeyDate": "today",
+        "travelClass": "economy"
+    },
+    "metadata": {
+        "run_id": "3e2d0a89-be92-45ef-8e10-1d64f7bd24ec",
+        "feedback_tokens": []
+    }
+}
+_EXTRACT_RESPONSE = example_response(TripPlanExtractResponse, _EXTRACT_EXAMPLE, etag=True)
+
+@trip_plan_router.get("/extract", response_model=TripPlanExtractResponse,
+                     summary="Extract trip details from text",
+                     responses={
+                         200: {
+                             "content": {
+                                 "application/json": {
+                                     "example": _EXTRACT_EXAMPLE
+                                 }
+                             }
+                         }
+                     })
+async def extract_trip_plan(
+    text: Annotated[str, Query(description="Natural language text describing trip plans",
+                               openapi_examples={"example": {"value": "journey from dhaka to sylhet with 3 friends 4 days budget 5k"}})]
+):
+    """
+    Extract structured trip information from natural language description.
+    """
+    # This is just an example implementation
+    return _EXTRACT_RESPONSE
+
+_TRIP_PLAN_EXAMPLE = {
+    "output": {
+        "trip_name": "Dhaka to Sylhet 3 days trip with 4 people to enjoy the hill",
+        "origin": "Dhaka",
+        "destination": "Sylhet",
+        "days": "3",
+        "budget": {
+            "total": "2000",
+            "breakdown": {
+                "transportation": "800",
+                "food": "600",
+                "accommodation": "500",
+                "miscellaneous": "100"
+            }
+        },
+        "people": "4",
+        "preferences": "hill",
+        "tripType": "oneWay",
+        "journeyDate": "24/10/2024",
+        "travelClass": "economy",
+        # Additional output fields truncated for brevity
+    },
+    "metadata": {
+        "run_id": "6fff0355-b8e0-47c9-9776-40664d30d169",
+        "feedback_tokens": []
+    }
+}
+# The plan never changes, so clients may reuse it for an hour and revalidate by ETag
+_TRIP_PLAN_RESPONSE = example_response(
+    TripPlanResponse,
+    _TRIP_PLAN_EXAMPLE,
+    etag=True,
+    headers={"Cache-Control": "public, max-age=3600"}
+)
+
+# Documented with the sections the example body leaves out
+_TRIP_PLAN_DOC_EXAMPLE = {
+    "output": {
+        **_TRIP_PLAN_EXAMPLE["output"],
+        "checkpoints": [
+            {
+                "origin": {
+                    "location": "Dhaka",
+                    "latitude": "23.8103",
+                    "longitude": "90.4125"
+                },
+                "destination": {
+                    "location": "Sylhet",
+                    "latitude": "24.8949",
+                    "longitude": "91.8687"
+                },
+                "logistics": {
+                    "departure_time": "06:00 AM",
+                    "arrival_time": "12:00 PM",
+                    "tips": "Take an early morning bus from Dhaka to Sylhet to enjoy the scenic beauty along the way."
+                }
+            }
+        ],
+        "food": {
+            "1": {
+                "breakfast": {
+                    "title": "Panshi Restaurant",
+                    "address": "Jallarpar Rd, Sylhet 3100",
+                    "latitude": 24.895068799999997,
+                    "longitude": 91.8674443,
+                    "rating": 4.2,
+                    "ratingCount": 18000,
+                    "category": "Bangladeshi restaurant",
+                    "phoneNumber": "01761-152939",
+                    "cid": "4184260984599101480",
+                    "cost": "150"
+                },
+                "launch": {
+                    "title": "Pach Bhai Restaurant",
+                    "address": "Jallarpar Rd, Sylhet 3100",
+                    "latitude": 24.8946981,
+                    "longitude": 91.8664029,
+                    "rating": 4.3,
+                    "ratingCount": 16000,
+                    "category": "Bangladeshi restaurant",
+                    "phoneNumber": "01710-459607",
+                    "cid": "1251724275242512479",
+                    "cost": "200"
+                },
+                "dinner": {
+                    "title": "The Mad Grill",
+                    "address": "Nayasarak Point, Manik Pir Road, 3100",
+                    "latitude": 24.8995748,
+                    "longitude": 91.87515789999999,
+                    "rating": 4.3,
+                    "ratingCount": 2300,
+                    "category": "Restaurant",
+                    "phoneNumber": "01954-556677",
+                    "website": "https://www.facebook.com/themadgrill/",
+                    "cid": "9696671651361504064",
+                    "cost": "250"
+                }
+            }
+        },
+        "accommodation": {
+            "1": {
+                "title": "The Grand Hotel",
+                "address": "4th Floor, H. S. Tower, HS Tower 3rd Floor Waves -1 East, Waves-1 Dargah Gate, Sylhet 3100",
+                "latitude": 24.901723,
+                "longitude": 91.86977929999999,
+                "rating": 4,
+                "ratingCount": 564,
+                "category": "Hotel",
+                "phoneNumber": "01970-793366",
+                "cid": "16335710689796874260"
+            },
+            "2": {
+                "title": "Hotel Noorjahan Grand",
+                "address": "Waves 1 Dargah Gate, Sylhet 3100",
+                "latitude": 24.901979599999997,
+                "longitude": 91.8696968,
+                "rating": 4.2,
+                "ratingCount": 2900,
+                "category": "Hotel",
+                "phoneNumber": "01930-111666",
+                "website": "http://www.noorjahangrand.com/",
+                "cid": "15253580246980481310"
+            }
+        },
+        "weather": [
+            {
+                "date": "2024-10-24",
+                "temperature": 28.5,
+                "conditions": "Partly Cloudy",
+                "humidity": 72,
+                "wind_speed": 8.5,
+                "precipitation_chance": 15.0
+            },
+            {
+                "date": "2024-10-25",
+                "temperature": 29.2,
+                "conditions": "Sunny",
+                "humidity": 70,
+                "wind_speed": 7.2,
+                "precipitation_chance": 5.0
+            },
+            {
+                "date": "2024-10-26",
+                "temperature": 27.8,
+                "conditions": "Light Rain",
+                "humidity": 85,
+                "wind_speed": 10.5,
+                "precipitation_chance": 60.0
+            }
+        ],
+        "traffic": {
+            "current": {
+                "level": "MODERATE",
+                "estimated_delay_minutes": 25,
+                "congestion_points": ["Mohakhali Flyover", "Kuril Bishwa Road"],
+                "best_departure_time": "05:30 AM"
+            },
+            "forecast": {
+                "morning_rush": "HIGH",
+                "evening_rush": "VERY_HIGH",
+                "weekend_traffic": "MODERATE",
+                "road_conditions": "Good with some construction near the destination"
+            }
+        },
+        "spotSuggestions": [
+            {
+                "name": "Ratargul Swamp Forest",
+                "description": "A freshwater swamp forest famous for boat rides through submerged trees.",
+                "latitude": 25.0056,
+                "longitude": 91.9583,
+                "recommendedTime": "Morning",
+                "estimatedDurationHours": 3
+            },
+            {
+                "name": "Jaflong",
+                "description": "A scenic border area with hills, rivers, and stone collection activities.",
+                "latitude": 25.1597,
+                "longitude": 92.0216,
+                "recommendedTime": "Afternoon",
+                "estimatedDurationHours": 4
+            },
+            {
+                "name": "Bisnakandi",
+                "description": "A beautiful spot where several streams from Meghalaya converge.",
+                "latitude": 25.2282,
+                "longitude": 92.0078,
+                "recommendedTime": "Morning or Early Afternoon",
+                "estimatedDurationHours": 3
+            },
+            {
+                "name": "Hazrat Shah Jalal Mazar",
+                "description": "A historical and religious shrine in the heart of Sylhet.",
+                "latitude": 24.8992,
+                "longitude": 91.8701,
+                "recommendedTime": "Evening",
+                "estimatedDurationHours": 1
+            }
+        ]
+    },
+    "metadata": _TRIP_PLAN_EXAMPLE["metadata"]
+}
+
+@trip_plan_router.get("", response_model=TripPlanResponse,
+                    responses={
+                        200: {
+                            "content": {
+                                "application/json": {
+                                    "example": _TRIP_PLAN_DOC_EXAMPLE
+                                }
+                            }
+                        }
+                    })
+async def generate_trip_plan(
+    origin: Annotated[str, Query(description="Starting location", openapi_examples={"example": {"value": "Dhaka"}})] = None,
+    destination: Annotated[str, Query(description="Destination location", openapi_examples={"example": {"value": "Sylhet"}})] = None,
+    start_date: Annotated[Optional[date], Query(description="Trip start date", openapi_examples={"example": {"value": "2024-10-24"}})] = None,
+    days: Annotated[Optional[int], Query(description="Trip duration in days", openapi_examples={"example": {"value": 3}}, ge=1, le=30)] = None,
+    budget: Annotated[Optional[float], Query(description="Trip budget", openapi_examples={"example": {"value": 5000.0}}, ge=0)] = None,
+    people: Annotated[Optional[int], Query(description="Number of travelers", openapi_examples={"example": {"value": 4}}, ge=1)] = None
+):
+    """
+    Generate a complete trip itinerary based on user preferences.
+    """
+    # This is just an example implementation
+    return _TRIP_PLAN_RESPONSE
@@ -0,0 +1,133 @@
+from fastapi import APIRouter, Body, Path, Response
+from typing import Annotated, List
+
+from json_templates import json_template, render_template
+from models import WeatherData, WeatherCheckRequest, WeatherCheckResponse, TripChangeRequest, TripChangeResponse
+from responses import example_response
+
+# Weather Router
+weather_router = APIRouter(prefix="/v1/weather", tags=["Weather"])
+
+_FORECAST_EXAMPLE = [
+    {
+        "location": {"city": "Paris", "country": "France", "latitude": 48.8566, "longitude": 2.3522},
+        "date": "2025-06-01",
+        "temperature": 22.5,
+        "conditions": "Partly Cloudy",
+        "humidity": 65,
+        "wind_speed": 12.0,
+        "precipitation_chance": 20.0
+    }
+]
+# Forecasts may be up to a minute stale
+_FORECAST_RESPONSE = example_response(
+    List[WeatherData],
+    _FORECAST_EXAMPLE,
+    etag=True,
+    headers={"Cache-Control": "public, max-age=60"}
+)
+
+@weather_router.get("/forecast/{trip_id}", response_model=List[WeatherData],
+                  responses={
+                      200: {
+                          "content": {
+                              "application/json": {
+                                  "example": _FORECAST_EXAMPLE
+                              }
+                          }
+                      }
+                  })
+async def get_weather_forecast(
+    trip_id: Annotated[str, Path(description="ID of the trip to get weather forecast for", openapi_examples={"example": {"value": "trip123"}})]
+):
+    """
+    Get weather forecast for a trip's destination and dates.
+    """
+    # This is just an example implementation
+    return _FORECAST_RESPONSE
+
+_WEATHER_CHECK_EXAMPLE = {
+    "message": "Severe weather alert detected. Trip update suggested.",
+    "severe_weather_days": [
+        {
+            "date": "2025-05-11",
+            "condition": "Typhoon",
+            "risk_level": "High",
+            "reason": "Strong winds and potential flooding"
+        }
+    ],
+    "recommended_actions": [
+        "Postpone trip to start from 2025-05-17",
+        "Or change destination to Chiang Mai"
+    ],
+    "proposed_itinerary_change": {
+        "new_start_date": "2025-05-17",
+        "new_end_date": "2025-05-22",
+        "new_destination": "Chiang Mai"
+    },
+    "user_decision_required": True
+}
+_WEATHER_CHECK_RESPONSE = example_response(WeatherCheckResponse, _WEATHER_CHECK_EXAMPLE)
+
+@weather_router.post("/check", response_model=WeatherCheckResponse,
+                   responses={
+                       200: {
+                           "content": {
+                               "application/json": {
+                                   "example": _WEATHER_CHECK_EXAMPLE
+                               }
+                           }
+                       }
+                   })
+async def check_weather_conditions(request: WeatherCheckRequest = Body(
+    ...,
+    example={
+        "trip_id": "abc123",
+        "destination": "Bangkok",
+        "start_date": "2025-05-10",
+        "end_date": "2025-05-15"
+    }
+)):
+    """
+    Check for severe weather conditions that might affect trip plans.
+    """
+    # This is just an example implementation
+    return _WEATHER_CHECK_RESPONSE
+
+_TRIP_CHANGE_EXAMPLE = {
+    "message": "Trip updated successfully",
+    "trip_id": "abc123",
+    "new_itinerary": {
+        "start_date": "2025-05-17",
+        "end_date": "2025-05-22",
+        "destination": "Chiang Mai"
+    }
+}
+# Only the trip ID comes from the request; the rest is encoded once here
+TripChangeResponse.model_validate(_TRIP_CHANGE_EXAMPLE)
+_TRIP_CHANGE_TEMPLATE = json_template({**_TRIP_CHANGE_EXAMPLE, "trip_id": "__trip_id__"}, "trip_id")
+
+@weather_router.post("/trip/confirm-change", response_model=TripChangeResponse,
+                   responses={
+                       200: {
+                           "content": {
+                               "application/json": {
+                                   "example": _TRIP_CHANGE_EXAMPLE
+                               }
+                           }
+                       }
+                   })
+async def confirm_trip_change(request: TripChangeRequest = Body(
+    ...,
+    example={
+        "trip_id": "abc123",
+        "confirm": True,
+        "new_start_date": "2025-05-17",
+        "new_destination": "Chiang Mai"
+    }
+)):
+    """
+    Endpoint for users to accept the weather-based trip change suggestion.
+    """
+    # This is just an example implementation
+    return Response(content=render_template(_TRIP_CHANGE_TEMPLATE, trip_id=request.trip_id), media_type="application/json")
@@ -0,0 +1,141 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from typing import Optional
+from datetime import timedelta
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from cachetools import TTLCache
+import orjson
+import base64
+import calendar
+import functools
+import hashlib
+import hmac
+import time
+
+from clock import clock
+from models import TokenData
+
+# Authentication setup
+SECRET_KEY = "your-secret-key-for-jwt-should-be-very-secure-in-production"
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/login")
+
+# Tokens are always HS256 with the same header, so it is encoded once and the
+# keyed HMAC state is copied per token instead of being rebuilt from the secret
+_JWT_HEADER = base64.urlsafe_b64encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"})).rstrip(b"=")
+_JWT_HMAC = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+@functools.cache
+def get_password_hasher() -> PasswordHasher:
+    # Argon2id with the OWASP-recommended minimum cost parameters; built on first use
+    return PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Argon2 is CPU-bound by design; async handlers should call these through
+# asyncio.to_thread so a login or registration doesn't stall the event loop
+def verify_password(plain_password, hashed_password):
+    try:
+        return get_password_hasher().verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def get_password_hash(password):
+    return get_password_hasher().hash(password)
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+def _jwt_signature(signing_input: bytes) -> bytes:
+    mac = _JWT_HMAC.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+def _int_claim(claims: dict, name: str, error: type) -> int:
+    # Any number (or numeric string) is taken, as by jwt.decode
+    try:
+        return int(claims[name])
+    except (TypeError, ValueError):
+        raise error(f"{name} claim must be an integer.")
+
+def encode_jwt(payload: dict) -> str:
+    signing_input = _JWT_HEADER + b"." + base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    signature = base64.urlsafe_b64encode(_jwt_signature(signing_input)).rstrip(b"=")
+    return (signing_input + b"." + signature).decode()
+
+def decode_jwt(token: str) -> dict:
+    """
+    Verify an HS256 token issued by encode_jwt and return its claims.
+    Raises the matching jwt.PyJWTError subclass when the token is invalid or expired.
+    """
+    signing_input, _, signature = token.encode().rpartition(b".")
+    header, _, payload = signing_input.partition(b".")
+    if header != _JWT_HEADER:
+        raise jwt.DecodeError("Invalid header")
+    try:
+        signature = _b64url_decode(signature)
+        claims = orjson.loads(_b64url_decode(payload))
+    except (ValueError, orjson.JSONDecodeError) as exc:
+        raise jwt.DecodeError("Invalid token encoding") from exc
+    if not hmac.compare_digest(_jwt_signature(signing_input), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    if not isinstance(claims, dict):
+        raise jwt.DecodeError("Invalid payload")
+    # The same registered claim checks jwt.decode makes with its default options
+    now = int(time.time())
+    if "iat" in claims and _int_claim(claims, "iat", jwt.InvalidIssuedAtError) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in claims and _int_claim(claims, "nbf", jwt.DecodeError) > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "exp" in claims and _int_claim(claims, "exp", jwt.DecodeError) <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    # No audience is configured, so tokens meant for a particular one are refused
+    if claims.get("aud"):
+        raise jwt.InvalidAudienceError("Invalid audience")
+    return claims
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = clock.utcnow + expires_delta
+    else:
+        expire = clock.utcnow + timedelta(minutes=15)
+    to_encode.update({"exp": calendar.timegm(expire.utctimetuple())})
+    encoded_jwt = encode_jwt(to_encode)
+    return encoded_jwt
+
+# Tokens that already passed verification, keyed by a digest of the token.
+# Entries carry the token's exp so they are never trusted past it.
+_verified_tokens = TTLCache(maxsize=10_000, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _verified_tokens.get(cache_key)
+    if cached is not None and (cached[1] is None or cached[1] > time.time()):
+        token_data = cached[0]
+    else:
+        try:
+            payload = decode_jwt(token)
+            user_id: str = payload.get("sub")
+            if user_id is None:
+                raise credentials_exception
+            token_data = TokenData(user_id=user_id)
+        except jwt.PyJWTError:
+            raise credentials_exception
+        _verified_tokens[cache_key] = (token_data, int(payload["exp"]) if "exp" in payload else None)
+    
+    # In a real app, we would fetch the user from the database
+    # Here we're just mocking it
+    user = {"id": token_data.user_id, "username": "testuser", "email": "test@example.com", "full_name": "Test User", "created_at": clock.now}
+    
+    if user is None:
+        raise credentials_exception
+    return user
@@ -0,0 +1,16 @@
+from clock import CachedClock
+
+def test_refreshes_on_access_without_task(monkeypatch):
+    monkeypatch.setattr("clock.time.time", lambda: 1_700_000_000.25)
+    clock = CachedClock()
+    monkeypatch.setattr("clock.time.time", lambda: 1_700_000_005.5)
+    assert clock.now_json == CachedClock().now_json
+    assert clock.timestamp == 1_700_000_005
+
+def test_task_keeps_the_cached_time(monkeypatch):
+    monkeypatch.setattr("clock.time.time", lambda: 1_700_000_000.25)
+    clock = CachedClock()
+    clock.task = object()  # stands in for the running refresh task
+    monkeypatch.setattr("clock.time.time", lambda: 1_700_000_005.5)
+    clock.now
+    assert clock.timestamp == 1_700_000_000
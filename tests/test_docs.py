@@ -0,0 +1,11 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+@pytest.mark.parametrize("path", ["/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"])
+@pytest.mark.parametrize("method", ["GET", "HEAD"])
+def test_docs_routes(path, method):
+    assert client.request(method, path).status_code == 200
@@ -0,0 +1,41 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from middleware import MAX_BODY_SIZE
+
+client = TestClient(app)
+
+BLOG = {"title": "Paris", "content": "What a trip"}
+
+@pytest.mark.parametrize("content_type", ["application/json", "application/json; charset=utf-8", "application/vnd.api+json"])
+def test_accepts_json_media_types(content_type):
+    response = client.post("/v1/blogs", content=orjson.dumps(BLOG), headers={"Content-Type": content_type})
+    assert response.status_code == 201
+
+@pytest.mark.parametrize("headers", [{}, {"Content-Type": ""}])
+def test_body_without_media_type_is_json(headers):
+    response = client.post("/v1/blogs", content=orjson.dumps(BLOG), headers=headers)
+    assert response.status_code == 201
+
+def test_refuses_other_media_types():
+    response = client.post("/v1/blogs", content=orjson.dumps(BLOG), headers={"Content-Type": "text/plain"})
+    assert response.status_code == 415
+
+def test_refuses_large_declared_body():
+    response = client.post("/v1/blogs", content=b" " * (MAX_BODY_SIZE + 1), headers={"Content-Type": "application/json"})
+    assert response.status_code == 413
+
+def test_counts_chunked_body():
+    def chunks(size):
+        yield b'{"place": "'
+        yield b"x" * size
+        yield b'"}'
+
+    path = "/v1/profile/trips/t001/todolist"
+    headers = {"Content-Type": "application/json"}
+    assert client.post(path, content=chunks(10), headers=headers).status_code == 200
+    response = client.post(path, content=chunks(MAX_BODY_SIZE), headers=headers)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large"}
@@ -0,0 +1,78 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+VISIT = "/v1/profile/trips/t001/todolist/visit"
+
+def test_marks_place_visited():
+    response = client.put(VISIT, json={"place": 'The "Old" Town'})
+    assert response.status_code == 200
+    assert response.json()["message"] == "Marked 'The \"Old\" Town' as visited."
+
+def test_malformed_json_gets_fastapi_error():
+    response = client.put(VISIT, content=b"{", headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+    assert response.json()["detail"] == [{
+        "type": "json_invalid",
+        "loc": ["body", 1],
+        "msg": "JSON decode error",
+        "input": {},
+        "ctx": {"error": "Expecting property name enclosed in double quotes"}
+    }]
+
+def test_missing_place():
+    response = client.put(VISIT, json={})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", "place"]]
+
+def test_body_that_is_not_utf8_gets_fastapi_error():
+    response = client.put(VISIT, content=b'{"place": "\xff"}', headers={"Content-Type": "application/json"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "There was an error parsing the body"}
+
+def test_lone_surrogate_in_place():
+    response = client.put(VISIT, content=b'{"place": "\\ud800"}', headers={"Content-Type": "application/json"})
+    assert response.status_code == 200
+    assert response.json()["message"] == "Marked '\ud800' as visited."
+
+def test_place_request_bodies_refer_to_component():
+    schema = app.openapi()
+    assert schema["components"]["schemas"]["PlaceUpdateRequest"] == {
+        "properties": {"place": {"title": "Place", "type": "string"}},
+        "required": ["place"],
+        "title": "PlaceUpdateRequest",
+        "type": "object"
+    }
+    paths = schema["paths"]
+    ref = {"$ref": "#/components/schemas/PlaceUpdateRequest"}
+    assert paths["/v1/profile/trips/{trip_id}/todolist"]["post"]["requestBody"]["content"]["application/json"]["schema"] == ref
+    assert paths["/v1/profile/trips/{trip_id}/todolist/visit"]["put"]["requestBody"]["content"]["application/json"]["schema"]["allOf"] == [ref]
+
+def test_hand_documented_parameters():
+    paths = app.openapi()["paths"]
+    assert paths["/v1/profile"]["get"]["parameters"] == [{
+        "description": "User ID to fetch profile for (defaults to authenticated user)",
+        "in": "query",
+        "name": "user_id",
+        "required": False,
+        "schema": {
+            "anyOf": [{"type": "string"}, {"type": "null"}],
+            "description": "User ID to fetch profile for (defaults to authenticated user)",
+            "examples": {"example": {"value": "u123"}},
+            "title": "User Id"
+        }
+    }]
+    assert paths["/v1/profile/trips/{trip_id}"]["get"]["parameters"] == [{
+        "description": "ID of the trip to get details for",
+        "in": "path",
+        "name": "trip_id",
+        "required": True,
+        "schema": {
+            "description": "ID of the trip to get details for",
+            "examples": {"example": {"value": "t001"}},
+            "title": "Trip Id",
+            "type": "string"
+        }
+    }]
@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+import security
+from security import ALGORITHM, SECRET_KEY, decode_jwt, encode_jwt
+
+def test_round_trip():
+    claims = {"sub": "u123", "exp": int(time.time()) + 60}
+    assert decode_jwt(encode_jwt(claims)) == claims
+
+def test_accepts_pyjwt_token():
+    claims = {"sub": "u123", "exp": int(time.time()) + 60}
+    assert decode_jwt(jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)) == claims
+
+def test_pyjwt_accepts_our_token():
+    claims = {"sub": "u123", "exp": int(time.time()) + 60}
+    assert jwt.decode(encode_jwt(claims), SECRET_KEY, algorithms=[ALGORITHM]) == claims
+
+def test_tampered_signature():
+    token = encode_jwt({"sub": "u123"})
+    signing_input, _, signature = token.rpartition(".")
+    tampered = signing_input + "." + ("A" if signature[0] != "A" else "B") + signature[1:]
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_jwt(tampered)
+
+def test_tampered_payload():
+    header, _, signature = encode_jwt({"sub": "u123"}).split(".")
+    payload = encode_jwt({"sub": "admin"}).split(".")[1]
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_jwt(".".join((header, payload, signature)))
+
+def test_expired():
+    token = encode_jwt({"sub": "u123", "exp": int(time.time()) - 1})
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_jwt(token)
+
+def test_float_exp_accepted():
+    claims = {"sub": "u123", "exp": time.time() + 60}
+    assert decode_jwt(encode_jwt(claims)) == claims
+
+def test_future_nbf():
+    token = encode_jwt({"sub": "u123", "nbf": int(time.time()) + 60})
+    with pytest.raises(jwt.ImmatureSignatureError):
+        decode_jwt(token)
+
+def test_past_nbf_accepted():
+    assert decode_jwt(encode_jwt({"sub": "u123", "nbf": int(time.time()) - 60}))["sub"] == "u123"
+
+def test_audience_refused():
+    with pytest.raises(jwt.InvalidAudienceError):
+        decode_jwt(encode_jwt({"sub": "u123", "aud": "someone-else"}))
+
+def test_non_numeric_iat():
+    with pytest.raises(jwt.InvalidIssuedAtError):
+        decode_jwt(encode_jwt({"sub": "u123", "iat": "yesterday"}))
+
+def test_future_iat():
+    with pytest.raises(jwt.ImmatureSignatureError):
+        decode_jwt(encode_jwt({"sub": "u123", "iat": int(time.time()) + 60}))
+
+@pytest.mark.parametrize("extra", [
+    {},
+    {"exp": 1e12},
+    {"exp": 1},
+    {"exp": "not a number"},
+    {"nbf": 1e12},
+    {"nbf": 1},
+    {"iat": 1},
+    {"iat": 1e12},
+    {"iat": "yesterday"},
+    {"aud": "api"},
+    {"aud": ""},
+])
+def test_agrees_with_pyjwt(extra):
+    token = encode_jwt({"sub": "u123", **extra})
+    try:
+        expected = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.PyJWTError as exc:
+        with pytest.raises(type(exc)):
+            decode_jwt(token)
+    else:
+        assert decode_jwt(token) == expected
+
+@pytest.fixture
+def token_cache():
+    security._verified_tokens.clear()
+    yield security._verified_tokens
+    security._verified_tokens.clear()
+
+def current_user(token):
+    return asyncio.run(security.get_current_user(token))
+
+def test_cached_token_is_reused(token_cache, monkeypatch):
+    token = encode_jwt({"sub": "u123", "exp": int(time.time()) + 60})
+    assert current_user(token)["id"] == "u123"
+    assert len(token_cache) == 1
+
+    def fail(token):
+        raise AssertionError("verified twice")
+
+    monkeypatch.setattr(security, "decode_jwt", fail)
+    assert current_user(token)["id"] == "u123"
+
+def test_cached_token_expires(token_cache, monkeypatch):
+    now = time.time()
+    token = encode_jwt({"sub": "u123", "exp": int(now) + 60})
+    current_user(token)
+    monkeypatch.setattr(security.time, "time", lambda: now + 120)
+    with pytest.raises(HTTPException) as exc_info:
+        current_user(token)
+    assert exc_info.value.status_code == 401
+
+@pytest.mark.parametrize("claims", [
+    {"sub": "u123", "exp": 1},
+    {"sub": "u123", "nbf": 10**12},
+    {"exp": 10**12},
+])
+def test_failed_tokens_are_not_cached(token_cache, claims):
+    with pytest.raises(HTTPException):
+        current_user(encode_jwt(claims))
+    assert len(token_cache) == 0
+
+def test_bad_signature_is_not_cached(token_cache):
+    signing_input, _, _ = encode_jwt({"sub": "u123"}).rpartition(".")
+    with pytest.raises(HTTPException):
+        current_user(signing_input + ".AAAA")
+    assert len(token_cache) == 0
@@ -0,0 +1,25 @@
+from trip_planning import extract_trip_details_from_text
+
+def test_extracts_all_details():
+    details = extract_trip_details_from_text("journey from Dhaka to Sylhet with 3 friends 4 days budget 5k")
+    assert details["origin"] == "Dhaka"
+    assert details["destination"] == "Sylhet"
+    assert details["days"] == "4"
+    assert details["budget"] == "5000"
+    assert details["people"] == "4"
+
+def test_overlapping_details_are_all_found():
+    # "to 4" and "4 days" share the 4
+    assert extract_trip_details_from_text("trip to 4 days in sylhet from dhaka")["days"] == "4"
+    # "to 3" and "3 friends" share the 3
+    assert extract_trip_details_from_text("from dhaka to 3 friends")["people"] == "4"
+
+def test_first_match_of_each_detail_wins():
+    details = extract_trip_details_from_text("from dhaka to sylhet, then from sylhet to jaflong")
+    assert details["origin"] == "dhaka"
+    assert details["destination"] == "sylhet"
+
+def test_people_and_persons_count_the_user():
+    assert extract_trip_details_from_text("dhaka to sylhet for 4 people")["people"] == "4"
+    assert extract_trip_details_from_text("dhaka to sylhet, 3 persons")["people"] == "3"
+    assert extract_trip_details_from_text("dhaka to sylhet, 1 person")["people"] == "1"
@@ -0,0 +1,23 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+CONFIRM = "/v1/weather/trip/confirm-change"
+
+def confirm(trip_id_json: str):
+    body = '{"trip_id": %s, "confirm": true, "new_start_date": "2025-05-17", "new_destination": "Chiang Mai"}' % trip_id_json
+    return client.post(CONFIRM, content=body.encode(), headers={"Content-Type": "application/json"})
+
+def test_echoes_trip_id():
+    response = confirm('"t\\"42"')
+    assert response.status_code == 200
+    assert response.json()["trip_id"] == 't"42'
+
+def test_echoes_lone_surrogate():
+    response = confirm('"\\ud800"')
+    assert response.status_code == 200
+    assert json.loads(response.content)["trip_id"] == "\ud800"
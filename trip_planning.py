@@ -0,0 +1,135 @@
+from typing import Any, Dict
+import functools
+import os
+import re
+import string
+import orjson
+
+from json_templates import json_template, render_template
+
+# Helper functions for trip planning
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# One alternation per trip detail, so the text is scanned in a single pass.
+# Each alternative is a lookahead and consumes nothing, so details that overlap
+# (as in "to 4 days") are all found, just as with a separate search per detail.
+# It runs on lowercased text instead of using re.IGNORECASE.
+_TRIP_DETAILS_RE = re.compile(
+    r'(?=from\s+(?P<origin>\w+))'
+    r'|(?=to\s+(?P<destination>\w+))'
+    r'|(?=(?P<days>\d+)\s*days?\b)'
+    r'|(?=budget\s+(?P<budget>\d+k?))'
+    r'|(?=(?P<people>\d+)\s+friends?\b)'
+    r'|(?=(?P<travelers>\d+)\s+(?:people|persons?)\b)'
+)
+
+# Lowercases A-Z only, so offsets in the result line up with the original text
+_ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def extract_trip_details_from_text(text: str) -> Dict[str, Any]:
+    """
+    Extract trip details from natural language text using simple pattern matching.
+    In a real app, this would use a more sophisticated NLP model.
+    """
+    # Very basic extraction logic - would be replaced with actual NLP
+    # Match on the lowercased copy, but take the values from the original text
+    matches = {}
+    for match in _TRIP_DETAILS_RE.finditer(text.translate(_ASCII_LOWERCASE)):
+        matches.setdefault(match.lastgroup, text[match.start(match.lastgroup):match.end(match.lastgroup)])
+    
+    origin = matches.get("origin", "")
+    destination = matches.get("destination", "")
+    days = matches.get("days", "")
+    budget = matches.get("budget", "")
+    if budget.endswith(("k", "K")):
+        budget = str(int(budget[:-1]) * 1000)
+    # "N people" already counts the user; "N friends" does not
+    if "travelers" in matches:
+        people = str(int(matches["travelers"]))
+    else:
+        people = str(int(matches["people"]) + 1) if "people" in matches else "1"  # +1 to include the user
+    
+    return {
+        "origin": origin,
+        "destination": destination,
+        "days": days,
+        "budget": budget,
+        "people": people,
+        "preferences": "",
+        "tripType": "oneWay",
+        "journeyDate": "today",
+        "travelClass": "economy"
+    }
+
+# Checkpoint coordinates for the locations we have mock data for, keyed by casefolded
+# name and stored as encoded JSON strings ready to splice into the itinerary
+_COORDS = {
+    "dhaka": (b'"23.8103"', b'"90.4125"'),
+    "sylhet": (b'"24.8949"', b'"91.8687"'),
+}
+_DEFAULT_ORIGIN_COORDS = (b'"24.1233"', b'"90.5678"')
+_DEFAULT_DESTINATION_COORDS = (b'"23.9876"', b'"91.4567"')
+
+# Mock itinerary, encoded once at import; only the request-specific fields are filled in per call.
+# The template marks each of these fields with a "__<field>__" placeholder.
+_ITINERARY_FIELDS = (
+    "trip_name", "origin", "destination", "days", "budget",
+    "transportation", "food", "accommodation", "miscellaneous",
+    "people", "preferences", "trip_type", "journey_date", "travel_class",
+    "origin_latitude", "origin_longitude", "destination_latitude", "destination_longitude", "tips",
+)
+with open(os.path.join(DATA_DIR, "itinerary_template.json"), "rb") as template_file:
+    _ITINERARY_TEMPLATE = json_template(orjson.loads(template_file.read()), *_ITINERARY_FIELDS)
+
+# Pure function of its string arguments returning immutable bytes, so results can be
+# shared between requests; repeated plans skip building the body again
+@functools.lru_cache(maxsize=4096)
+def generate_trip_itinerary(
+    origin: str,
+    destination: str,
+    days: str,
+    budget: str,
+    people: str,
+    preferences: str,
+    trip_type: str,
+    journey_date: str,
+    travel_class: str
+) -> bytes:
+    """
+    Generate a trip itinerary based on user preferences, as encoded JSON.
+    In a real app, this would call an AI service or database.
+    """
+    # Mock data for demonstration
+    total_budget = int(budget)
+    transportation_budget = total_budget * 4 // 10
+    food_budget = total_budget * 3 // 10
+    accommodation_budget = total_budget // 4
+    misc_budget = total_budget - transportation_budget - food_budget - accommodation_budget
+
+    origin_latitude, origin_longitude = _COORDS.get(origin.casefold(), _DEFAULT_ORIGIN_COORDS)
+    destination_latitude, destination_longitude = _COORDS.get(destination.casefold(), _DEFAULT_DESTINATION_COORDS)
+
+    # Create a trip based on the inputs
+    return render_template(
+        _ITINERARY_TEMPLATE,
+        trip_name=f"{origin} to {destination} {days} days trip with {people} people" + (f" to enjoy the {preferences}" if preferences else ""),
+        origin=origin,
+        destination=destination,
+        days=days,
+        budget=budget,
+        transportation=str(transportation_budget),
+        food=str(food_budget),
+        accommodation=str(accommodation_budget),
+        miscellaneous=str(misc_budget),
+        people=people,
+        preferences=preferences,
+        trip_type=trip_type,
+        journey_date=journey_date,
+        travel_class=travel_class,
+        origin_latitude=origin_latitude,
+        origin_longitude=origin_longitude,
+        destination_latitude=destination_latitude,
+        destination_longitude=destination_longitude,
+        tips=f"Take an early morning bus from {origin} to {destination} to enjoy the scenic beauty along the way."
+    )
@@ -0,0 +1,7 @@
+from uvicorn.workers import UvicornWorker
+
+# Gunicorn worker for this app. The stock UvicornWorker picks the event loop and
+# HTTP parser by auto-detection and silently falls back to asyncio/h11 when
+# uvloop/httptools are missing; this one asks for them explicitly instead.
+class UvloopWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}